@@ -4,24 +4,46 @@ Bazaraki Electronics Deal Finder
 A comprehensive scraper for finding electronics deals on bazaraki.com
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import asyncio
+import aiohttp
+import numpy as np
+import csv
 import json
-import time
+import os
+import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
-from urllib.parse import urljoin, quote
+import threading
+from urllib.parse import urljoin
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON export then uses the stdlib encoder
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; keyword matching then uses the compiled regex
+    hyperscan = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the scoring kernel then runs as plain numpy
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +55,150 @@ logging.basicConfig(
     ]
 )
 
-@dataclass
+# CSS selectors for listing fields, tried in document order
+LISTING_SELECTORS = {
+    'title': "h1, .item-title, .listing-title",
+    'price': ".price, .item-price, .listing-price",
+    'location': ".location, .item-location",
+    'description': ".description, .item-description, .listing-description",
+    'seller_name': ".seller-name, .contact-name",
+    'contact_info': ".contact-info, .phone-number",
+    'posted_date': ".date-posted, .posting-date",
+    'images': ".gallery img, .listing-images img",
+}
+LISTING_LINK_SELECTOR = "a[href*='/en/item/']"
+MAX_LISTINGS_PER_PAGE = 20  # Limit per page to avoid overloading the site
+
+# Reads every field in a LISTING_SELECTORS-style dict (passed as arguments[0]) in one WebDriver call
+_LISTING_FIELDS_JS = """
+const selectors = arguments[0];
+const fields = {};
+for (const [field, selector] of Object.entries(selectors)) {
+    if (field === 'images') {
+        fields[field] = Array.from(document.querySelectorAll(selector), (img) => img.src).filter(Boolean);
+    } else {
+        const el = document.querySelector(selector);
+        fields[field] = el ? el.innerText.trim() : null;
+    }
+}
+return fields;
+"""
+
+# Price text such as "€1,200", "1 200 €" or "$ 950.50"
+_PRICE_RE = re.compile(r'(?P<cur>[€$£])?\s*(?P<num>\d[\d,.\s]*)(?P<trail>[€$£])?')
+_CURRENCY_SYMBOLS = {'€': 'EUR', '$': 'USD', '£': 'GBP'}
+# Approximate conversion rates to EUR
+_FX_TO_EUR = {'EUR': 1.0, 'USD': 0.92, 'GBP': 1.17}
+
+# HTML report templates, filled with str.format_map on each deal dict
+_REPORT_HEADER_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Bazaraki Electronics Deals Report</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .deal {{ border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                .deal-header {{ color: #d9534f; font-size: 18px; font-weight: bold; }}
+                .deal-score {{ background: #5cb85c; color: white; padding: 5px 10px; border-radius: 3px; display: inline-block; }}
+                .price {{ font-size: 20px; color: #337ab7; }}
+                .savings {{ color: #5cb85c; font-weight: bold; }}
+                .table {{ width: 100%; border-collapse: collapse; }}
+                .table th, .table td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+                .table th {{ background-color: #f2f2f2; }}
+            </style>
+        </head>
+        <body>
+            <h1>Bazaraki Electronics Deals Report</h1>
+            <p>Generated on: {generated}</p>
+            <p>Total deals found: {total}</p>
+            
+            <h2>Top Deals Summary</h2>
+            <table class="table">
+                <tr>
+                    <th>Product</th>
+                    <th>Price</th>
+                    <th>Market Price</th>
+                    <th>Savings</th>
+                    <th>Deal Score</th>
+                    <th>Location</th>
+                </tr>
+        """
+
+_REPORT_ROW_TMPL = """
+                <tr>
+                    <td>{title:.50}...</td>
+                    <td>€{price:.2f}</td>
+                    <td>€{market_price:.2f}</td>
+                    <td class="savings">€{savings:.2f}</td>
+                    <td><span class="deal-score">{deal_score:.1f}%</span></td>
+                    <td>{location}</td>
+                </tr>
+            """
+
+_REPORT_DETAILS_HEADING = """
+            </table>
+            
+            <h2>Detailed Deals</h2>
+        """
+
+_REPORT_CARD_TMPL = """
+            <div class="deal">
+                <div class="deal-header">{title}</div>
+                <div class="price">€{price:.2f} 
+                    <span class="deal-score">{deal_score:.1f}% OFF</span>
+                </div>
+                <p><strong>Market Price:</strong> €{market_price:.2f}</p>
+                <p><strong>You Save:</strong> <span class="savings">€{savings:.2f}</span></p>
+                <p><strong>Type:</strong> {product_type} ({condition})</p>
+                <p><strong>Location:</strong> {location}</p>
+                <p><strong>Seller:</strong> {seller}</p>
+                <p><strong>Posted:</strong> {posted_date}</p>
+                <p><strong>Description:</strong> {description}</p>
+                <p><a href="{url}" target="_blank">View Listing</a></p>
+            </div>
+            """
+
+_REPORT_FOOTER = """
+        </body>
+        </html>
+        """
+
+# Minimum percentage below market price for a listing to count as a deal
+MIN_DEAL_SCORE = 15.0
+
+@njit(cache=True)
+def _score_deals(prices, market_prices, min_score):
+    """Score listings against market prices; returns (is_deal mask, scores)"""
+    # Branchless equivalent of MarketPriceDatabase.calculate_deal_score
+    scores = np.where(
+        market_prices > 0,
+        (market_prices - prices) / np.maximum(market_prices, 1e-9) * 100.0,
+        0.0
+    )
+    return scores >= min_score, scores
+
+async def fetch(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """Fetch a page over HTTP, returning its HTML or None on failure"""
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                logging.warning(f"HTTP {response.status} fetching {url}")
+                return None
+            return await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.warning(f"Error fetching {url}: {e}")
+        return None
+
+def _search_text(title: str, description: str) -> str:
+    """Lowercased text that product identification matches against"""
+    # Reposted listings share a title and description opening, so that is the cache key
+    return f"{title.lower()} {description[:256].lower()}"
+
+# __slots__ keep per-listing memory down; dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ProductListing:
     """Data class for product listings"""
     title: str
@@ -50,6 +215,11 @@ class ProductListing:
     brand: str = ""
     model: str = ""
     condition: str = ""
+    search_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Lowercased once here rather than on every product lookup
+        self.search_text = _search_text(self.title, self.description)
     
 class MarketPriceDatabase:
     """Database for storing and comparing market prices"""
@@ -80,25 +250,28 @@ class MarketPriceDatabase:
         'asus_zenbook': {'used': 500, 'new': 1000, 'keywords': ['asus zenbook', 'zenbook']},
         'gaming_laptop': {'used': 800, 'new': 1500, 'keywords': ['gaming laptop', 'rog laptop', 'msi gaming']},
     }
-    
+
+    # Flat (keyword, product_id) index, longest keyword first so the most specific match wins
+    _KW: Tuple[Tuple[str, str], ...] = tuple(sorted(
+        ((keyword, product_id) for product_id, data in MARKET_PRICES.items() for keyword in data['keywords']),
+        key=lambda item: -len(item[0])
+    ))
+    _KEYWORD_PRODUCTS = dict(_KW)
+    # Position of each keyword in _KW; the lowest position wins, whichever matcher is used
+    _KEYWORD_RANK = {keyword: rank for rank, (keyword, _) in enumerate(_KW)}
+    # All keywords compiled into a single alternation, in _KW order; the lookahead
+    # reports overlapping matches so the longest keyword anywhere in the text is seen
+    _KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword, _ in _KW) + "))")
+    _NEW_RE = re.compile(r"\b(?:new|brand new|unopened|sealed)\b")
+    _REFURB_RE = re.compile(r"\b(?:refurbished|renewed|certified)\b")
+
     def identify_product(self, title: str, description: str) -> Optional[Tuple[str, str]]:
         """Identify product type and condition from title and description"""
-        text = f"{title} {description}".lower()
-        
-        # Determine condition
-        condition = "used"
-        if any(word in text for word in ["new", "brand new", "unopened", "sealed"]):
-            condition = "new"
-        elif any(word in text for word in ["refurbished", "renewed", "certified"]):
-            condition = "used"  # Treat refurbished as used for price comparison
-            
-        # Find matching product
-        for product_id, data in self.MARKET_PRICES.items():
-            for keyword in data['keywords']:
-                if keyword in text:
-                    return product_id, condition
-                    
-        return None, condition
+        return _identify_cached(_search_text(title, description))
+
+    def identify_listing(self, listing: ProductListing) -> Optional[Tuple[str, str]]:
+        """Identify product type and condition of a scraped listing"""
+        return _identify_cached(listing.search_text)
     
     def get_market_price(self, product_id: str, condition: str) -> Optional[float]:
         """Get market price for a product"""
@@ -112,23 +285,111 @@ class MarketPriceDatabase:
             return 0
         return ((market_price - listing_price) / market_price) * 100
 
+def _build_keyword_database():
+    """Compile all keywords into a Hyperscan database (None without hyperscan)"""
+    if hyperscan is None:
+        return None
+    keywords = MarketPriceDatabase._KW
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(keyword).encode() for keyword, _ in keywords],
+        ids=list(range(len(keywords))),
+        elements=len(keywords)
+    )
+    return database
+
+_KEYWORD_DB = _build_keyword_database()
+
+def _match_keyword(text: str) -> Optional[str]:
+    """Return the product keyword found in lowercased text that comes first in _KW (the longest)"""
+    if _KEYWORD_DB is not None:
+        hits = []
+        _KEYWORD_DB.scan(text.encode(), match_event_handler=lambda id_, start, end, flags, context: hits.append(id_))
+        # _KW is sorted longest first, so the lowest id is the longest keyword
+        return MarketPriceDatabase._KW[min(hits)][0] if hits else None
+
+    matches = MarketPriceDatabase._KEYWORD_RE.findall(text)
+    return min(matches, key=MarketPriceDatabase._KEYWORD_RANK.__getitem__) if matches else None
+
+@lru_cache(maxsize=4096)
+def _identify_cached(text: str) -> Tuple[Optional[str], str]:
+    """Identify product type and condition from lowercased listing text"""
+    # Determine condition
+    condition = "used"
+    if MarketPriceDatabase._NEW_RE.search(text):
+        condition = "new"
+    elif MarketPriceDatabase._REFURB_RE.search(text):
+        condition = "used"  # Treat refurbished as used for price comparison
+
+    # Find matching product; the longest (most specific) keyword wins
+    keyword = _match_keyword(text)
+    if keyword:
+        return MarketPriceDatabase._KEYWORD_PRODUCTS[keyword], condition
+
+    return None, condition
+
 class BazarakiScraper:
     """Main scraper class for bazaraki.com"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, max_concurrent: int = 10, max_workers: int = 4,
+                 scrape_images: bool = False, page_timeout: float = 10, rate_limit: float = 2):
         self.base_url = "https://www.bazaraki.com"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
+        self.max_concurrent = max_concurrent
+        self.max_workers = max_workers
+        self.page_timeout = page_timeout  # Max seconds to wait for a Selenium page to render
+        self.rate_limit = rate_limit  # Delay between category pages and Selenium fallback fetches in seconds
+        # Image URLs are not stored or reported, so only collect them on request
+        if scrape_images:
+            self.listing_selectors = LISTING_SELECTORS
+        else:
+            self.listing_selectors = {k: v for k, v in LISTING_SELECTORS.items() if k != 'images'}
         self.market_db = MarketPriceDatabase()
+        _score_deals(np.zeros(1), np.ones(1), MIN_DEAL_SCORE)  # Compile the scoring kernel up front
         self.setup_selenium(headless)
         self.setup_database()
         
     def setup_selenium(self, headless: bool):
-        """Setup Selenium WebDriver"""
+        """Setup Selenium WebDriver options; browsers start lazily on first use"""
+        self.headless = headless
+        # Each thread gets its own driver slot; every slot is tracked so close() can quit them
+        self._local = threading.local()
+        self._driver_slots = []
+        self._driver_slots_lock = threading.Lock()
+    
+    def _driver_slot(self) -> Dict:
+        """Return the calling thread's driver slot"""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            slot = self._local.slot = {}
+            with self._driver_slots_lock:
+                self._driver_slots.append(slot)
+        return slot
+    
+    def _slot_driver(self, slot: Dict):
+        """Return the WebDriver held in slot, starting it on first use"""
+        if 'driver' not in slot:
+            slot['driver'] = self._new_driver()
+        return slot['driver']
+    
+    def quit_drivers(self):
+        """Quit every WebDriver started so far"""
+        with self._driver_slots_lock:
+            slots = list(self._driver_slots)
+        for slot in slots:
+            driver = slot.pop('driver', None)
+            if driver:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logging.warning(f"Error closing WebDriver: {e}")
+    
+    def _new_driver(self):
+        """Create a new Selenium WebDriver instance"""
         chrome_options = Options()
-        if headless:
+        if self.headless:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -159,13 +420,14 @@ class BazarakiScraper:
                 from webdriver_manager.chrome import ChromeDriverManager
                 from selenium.webdriver.chrome.service import Service
                 service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
                 logging.info("Chrome WebDriver initialized with webdriver-manager")
             except Exception as e1:
                 logging.warning(f"Webdriver-manager failed: {e1}, trying default Chrome")
                 # Fallback to default Chrome
-                self.driver = webdriver.Chrome(options=chrome_options)
+                driver = webdriver.Chrome(options=chrome_options)
                 logging.info("Chrome WebDriver initialized with system Chrome")
+            return driver
                 
         except Exception as e:
             logging.error(f"Failed to initialize Chrome WebDriver: {e}")
@@ -177,14 +439,14 @@ class BazarakiScraper:
                     from selenium.webdriver.edge.options import Options as EdgeOptions
                     
                     edge_options = EdgeOptions()
-                    if headless:
+                    if self.headless:
                         edge_options.add_argument("--headless")
                     edge_options.add_argument("--no-sandbox")
                     edge_options.add_argument("--disable-dev-shm-usage")
                     
-                    self.driver = Edge(options=edge_options)
+                    driver = Edge(options=edge_options)
                     logging.info("Fallback to Edge WebDriver successful")
-                    return
+                    return driver
                 except Exception as e2:
                     logging.error(f"Edge fallback also failed: {e2}")
             
@@ -194,6 +456,9 @@ class BazarakiScraper:
         """Setup SQLite database for storing listings"""
         self.conn = sqlite3.connect('bazaraki_deals.db')
         cursor = self.conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS listings (
@@ -238,165 +503,213 @@ class BazarakiScraper:
         if not price_text:
             return 0.0, "EUR"
             
-        # Remove common non-numeric characters
-        price_text = price_text.replace(",", "").replace(" ", "")
-        
-        # Extract currency
-        currency = "EUR"
-        if "€" in price_text:
-            currency = "EUR"
-        elif "$" in price_text:
-            currency = "USD"
-        elif "£" in price_text:
-            currency = "GBP"
+        # Currency symbol (leading or trailing) and digits in one regex pass
+        price_match = _PRICE_RE.search(price_text)
+        if not price_match:
+            return 0.0, "EUR"
+        currency = _CURRENCY_SYMBOLS.get(price_match.group('cur') or price_match.group('trail'), "EUR")
         
-        # Extract numeric price
-        price_match = re.search(r'[\d.]+', price_text)
-        if price_match:
-            try:
-                price = float(price_match.group())
-                # Convert to EUR if needed (approximate rates)
-                if currency == "USD":
-                    price *= 0.92
-                elif currency == "GBP":
-                    price *= 1.17
-                return price, "EUR"  # Always return EUR for consistency
-            except ValueError:
-                pass
+        # Extract numeric price, dropping thousands separators and spaces
+        try:
+            price = float("".join(price_match.group('num').split()).replace(",", ""))
+            return price * _FX_TO_EUR[currency], "EUR"  # Always return EUR for consistency
+        except ValueError:
+            pass
                 
         return 0.0, currency
-    
-    def scrape_listing_details(self, listing_url: str) -> Optional[ProductListing]:
+
+    def build_listing(self, fields: Dict, listing_url: str) -> Optional[ProductListing]:
+        """Build a listing from extracted field texts (None without title and price)"""
+        if not fields.get('title') or fields.get('price') is None:
+            return None
+        price, currency = self.extract_price(fields['price'])
+
+        return ProductListing(
+            title=fields['title'],
+            price=price,
+            currency=currency,
+            location=fields.get('location') or "Cyprus",
+            url=listing_url,
+            description=fields.get('description') or "",
+            posted_date=fields.get('posted_date') or datetime.now().strftime("%Y-%m-%d"),
+            seller_name=fields.get('seller_name') or "N/A",
+            contact_info=fields.get('contact_info') or "N/A",
+            images=fields.get('images') or [],
+            category="Electronics"
+        )
+
+    def parse_listing_html(self, html: str, listing_url: str) -> Optional[ProductListing]:
+        """Parse a listing page fetched over HTTP (None if it needs JS rendering)"""
+        tree = LexborHTMLParser(html)
+
+        fields = {}
+        for field, selector in self.listing_selectors.items():
+            if field == 'images':
+                fields[field] = [src for src in (img.attributes.get("src") for img in tree.css(selector)) if src]
+            else:
+                node = tree.css_first(selector)
+                fields[field] = node.text().strip() if node is not None else None
+
+        # Title and price are required; without them the page is rendered client-side
+        return self.build_listing(fields, listing_url)
+
+    def extract_listing_links(self, html: str, page_url: str) -> List[str]:
+        """Extract unique listing URLs, in page order, from a category page fetched over HTTP"""
+        tree = LexborHTMLParser(html)
+        seen = {}
+        for link in tree.css(LISTING_LINK_SELECTOR):
+            href = link.attributes.get("href")
+            if href and "/en/item/" in href:
+                seen.setdefault(urljoin(page_url, href), None)
+                if len(seen) >= MAX_LISTINGS_PER_PAGE:
+                    break
+        return list(seen)
+
+    async def fetch_listing_details(self, session: aiohttp.ClientSession,
+                                    semaphore: asyncio.Semaphore,
+                                    listing_url: str) -> Optional[ProductListing]:
+        """Fetch and parse a single listing over HTTP"""
+        async with semaphore:
+            html = await fetch(session, listing_url)
+        if html is None:
+            return None
+        return self.parse_listing_html(html, listing_url)
+
+    def scrape_listing_details(self, listing_url: str, driver=None) -> Optional[ProductListing]:
         """Scrape detailed information from a single listing"""
+        driver = driver or self._slot_driver(self._driver_slot())
         try:
-            self.driver.get(listing_url)
-            time.sleep(2)
-            
-            # Extract title
-            title_element = self.driver.find_element(By.CSS_SELECTOR, "h1, .item-title, .listing-title")
-            title = title_element.text.strip() if title_element else "N/A"
-            
-            # Extract price
-            price_element = self.driver.find_element(By.CSS_SELECTOR, ".price, .item-price, .listing-price")
-            price_text = price_element.text.strip() if price_element else "0"
-            price, currency = self.extract_price(price_text)
-            
-            # Extract location
-            try:
-                location_element = self.driver.find_element(By.CSS_SELECTOR, ".location, .item-location")
-                location = location_element.text.strip()
-            except NoSuchElementException:
-                location = "Cyprus"
-            
-            # Extract description
-            try:
-                desc_element = self.driver.find_element(By.CSS_SELECTOR, ".description, .item-description, .listing-description")
-                description = desc_element.text.strip()
-            except NoSuchElementException:
-                description = ""
-            
-            # Extract seller info
-            try:
-                seller_element = self.driver.find_element(By.CSS_SELECTOR, ".seller-name, .contact-name")
-                seller_name = seller_element.text.strip()
-            except NoSuchElementException:
-                seller_name = "N/A"
-            
-            # Extract contact info
-            try:
-                contact_element = self.driver.find_element(By.CSS_SELECTOR, ".contact-info, .phone-number")
-                contact_info = contact_element.text.strip()
-            except NoSuchElementException:
-                contact_info = "N/A"
-            
-            # Extract images
-            images = []
-            try:
-                img_elements = self.driver.find_elements(By.CSS_SELECTOR, ".gallery img, .listing-images img")
-                images = [img.get_attribute("src") for img in img_elements if img.get_attribute("src")]
-            except NoSuchElementException:
-                pass
-            
-            # Extract posted date
+            driver.get(listing_url)
             try:
-                date_element = self.driver.find_element(By.CSS_SELECTOR, ".date-posted, .posting-date")
-                posted_date = date_element.text.strip()
-            except NoSuchElementException:
-                posted_date = datetime.now().strftime("%Y-%m-%d")
+                WebDriverWait(driver, self.page_timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_SELECTORS['title']))
+                )
+            except TimeoutException:
+                logging.warning(f"Timed out waiting for listing {listing_url} to render")
             
-            return ProductListing(
-                title=title,
-                price=price,
-                currency=currency,
-                location=location,
-                url=listing_url,
-                description=description,
-                posted_date=posted_date,
-                seller_name=seller_name,
-                contact_info=contact_info,
-                images=images,
-                category="Electronics"
-            )
+            # Extract all fields in a single WebDriver round-trip
+            fields = driver.execute_script(_LISTING_FIELDS_JS, self.listing_selectors)
+            listing = self.build_listing(fields, listing_url)
+            if listing is None:
+                logging.error(f"Error scraping listing {listing_url}: title or price not found")
+            return listing
             
         except Exception as e:
             logging.error(f"Error scraping listing {listing_url}: {e}")
             return None
     
-    def scrape_category(self, category_url: str, max_pages: int = 5) -> List[ProductListing]:
-        """Scrape listings from a category"""
-        listings = []
-        
-        for page in range(1, max_pages + 1):
-            try:
-                page_url = f"{category_url}?page={page}"
-                logging.info(f"Scraping page {page}: {page_url}")
-                
-                self.driver.get(page_url)
-                time.sleep(3)
-                
-                # Find listing links
-                listing_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/en/item/']")
-                
-                if not listing_links:
-                    logging.info(f"No more listings found on page {page}")
+    def get_listing_links_selenium(self, page_url: str, driver=None) -> List[str]:
+        """Extract unique listing URLs, in page order, from a category page rendered by Selenium"""
+        driver = driver or self._slot_driver(self._driver_slot())
+        driver.get(page_url)
+        try:
+            WebDriverWait(driver, self.page_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_LINK_SELECTOR))
+            )
+        except TimeoutException:
+            return []
+
+        seen = {}
+        for link in driver.find_elements(By.CSS_SELECTOR, LISTING_LINK_SELECTOR):
+            href = link.get_attribute("href")
+            if href and "/en/item/" in href:
+                seen.setdefault(href, None)
+                if len(seen) >= MAX_LISTINGS_PER_PAGE:
                     break
-                
-                # Extract listing URLs
-                urls = []
-                for link in listing_links:
-                    href = link.get_attribute("href")
-                    if href and "/en/item/" in href:
-                        urls.append(href)
-                
-                # Remove duplicates
-                urls = list(set(urls))
-                logging.info(f"Found {len(urls)} unique listings on page {page}")
-                
-                # Scrape each listing
-                for url in urls[:20]:  # Limit to 20 per page to avoid overloading
-                    listing = self.scrape_listing_details(url)
-                    if listing and listing.price > 0:  # Only include listings with valid prices
-                        listings.append(listing)
-                        time.sleep(1)  # Rate limiting
-                
-                time.sleep(2)  # Rate limiting between pages
-                
-            except Exception as e:
-                logging.error(f"Error scraping category page {page}: {e}")
-                continue
-        
+        return list(seen)
+
+    async def scrape_category_async(self, category_url: str, max_pages: int = 5, driver=None,
+                                    max_concurrent: Optional[int] = None) -> List[ProductListing]:
+        """Scrape listings from a category, fetching up to max_concurrent (default self.max_concurrent) listings at once"""
+        listings = []
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        fallback_fetches = 0
+        html_links_found = False
+        # Taken here, on the calling thread, so fallbacks reuse that thread's driver
+        # rather than one per executor thread
+        slot = self._driver_slot()
+
+        async def selenium_fallback(scrape, url):
+            """Run a blocking Selenium fetch off the event loop, rate limited"""
+            nonlocal fallback_fetches
+            if fallback_fetches:
+                await asyncio.sleep(self.rate_limit)
+            fallback_fetches += 1
+            # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: scrape(url, driver or self._slot_driver(slot)))
+
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
+            for page in range(1, max_pages + 1):
+                try:
+                    page_url = f"{category_url}?page={page}"
+                    logging.info(f"Scraping page {page}: {page_url}")
+
+                    # Find listing links, falling back to Selenium for JS-rendered pages.
+                    # Once plain HTML has yielded links in this category, a fetched page
+                    # without any is simply the end of the results.
+                    html = await fetch(session, page_url)
+                    urls = self.extract_listing_links(html, page_url) if html else []
+                    if urls:
+                        html_links_found = True
+                    elif html is None or not html_links_found:
+                        urls = await selenium_fallback(self.get_listing_links_selenium, page_url)
+
+                    if not urls:
+                        logging.info(f"No more listings found on page {page}")
+                        break
+
+                    logging.info(f"Found {len(urls)} unique listings on page {page}")
+
+                    results = await asyncio.gather(
+                        *[self.fetch_listing_details(session, semaphore, url) for url in urls],
+                        return_exceptions=True
+                    )
+
+                    for url, listing in zip(urls, results):
+                        if isinstance(listing, Exception):
+                            logging.error(f"Error fetching listing {url}: {listing}")
+                            listing = None
+                        if listing is None:
+                            listing = await selenium_fallback(self.scrape_listing_details, url)
+                        if listing and listing.price > 0:  # Only include listings with valid prices
+                            listings.append(listing)
+
+                    await asyncio.sleep(self.rate_limit)  # Rate limiting between pages
+
+                except Exception as e:
+                    logging.error(f"Error scraping category page {page}: {e}")
+                    continue
+
+        return listings
+
+    def scrape_category(self, category_url: str, max_pages: int = 5, driver=None,
+                        max_concurrent: Optional[int] = None) -> List[ProductListing]:
+        """Scrape listings from a category"""
+        return asyncio.run(self.scrape_category_async(category_url, max_pages, driver, max_concurrent))
+
+    def _scrape_category_in_worker(self, category_url: str, max_pages: int) -> List[ProductListing]:
+        """Scrape a category from a worker thread, using that worker's WebDriver if one is needed"""
+        logging.info(f"Scraping category: {category_url}")
+        # Each worker runs its own event loop, so max_concurrent is split between
+        # them to keep the total number of requests to bazaraki.com within it
+        listings = self.scrape_category(category_url, max_pages,
+                                        max_concurrent=max(1, self.max_concurrent // self.max_workers))
+        logging.info(f"Found {len(listings)} listings in category")
         return listings
     
     def analyze_deals(self, listings: List[ProductListing]) -> List[Dict]:
         """Analyze listings for good deals"""
         deals = []
+        rows = []
+        matched = []
         
         for listing in listings:
             try:
                 # Identify product and condition
-                product_id, condition = self.market_db.identify_product(
-                    listing.title, listing.description
-                )
+                product_id, condition = self.market_db.identify_listing(listing)
                 
                 if not product_id:
                     continue
@@ -406,56 +719,66 @@ class BazarakiScraper:
                 if not market_price:
                     continue
                 
-                # Calculate deal score
-                deal_score = self.market_db.calculate_deal_score(listing.price, market_price)
-                
-                # Only include if it's a good deal (at least 15% below market price)
-                if deal_score >= 15:
-                    deal_info = {
-                        'title': listing.title,
-                        'price': listing.price,
-                        'market_price': market_price,
-                        'deal_score': deal_score,
-                        'savings': market_price - listing.price,
-                        'location': listing.location,
-                        'url': listing.url,
-                        'description': listing.description[:200] + "..." if len(listing.description) > 200 else listing.description,
-                        'seller': listing.seller_name,
-                        'posted_date': listing.posted_date,
-                        'product_type': product_id.replace('_', ' ').title(),
-                        'condition': condition.title()
-                    }
-                    deals.append(deal_info)
-                    
-                    # Store in database
-                    self.store_listing(listing, market_price, deal_score)
+                matched.append((listing, product_id, condition, market_price))
                     
             except Exception as e:
                 logging.error(f"Error analyzing listing: {e}")
                 continue
         
-        # Sort by deal score (highest savings first)
-        deals.sort(key=lambda x: x['deal_score'], reverse=True)
-        return deals
-    
-    def store_listing(self, listing: ProductListing, market_price: float, deal_score: float):
-        """Store listing in database"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO listings 
-                (title, price, currency, location, url, description, posted_date, 
-                 seller_name, contact_info, category, market_price, deal_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        if not matched:
+            return deals
+        
+        # Score all matched listings at once and keep the good deals,
+        # highest savings first
+        prices = np.asarray([listing.price for listing, _, _, _ in matched], dtype=np.float64)
+        market_prices = np.asarray([market_price for _, _, _, market_price in matched], dtype=np.float64)
+        mask, scores = _score_deals(prices, market_prices, MIN_DEAL_SCORE)
+        good = np.flatnonzero(mask)
+        order = good[np.argsort(-scores[good], kind='stable')]
+        
+        for i in order:
+            listing, product_id, condition, market_price = matched[i]
+            deal_score = float(scores[i])
+            deal_info = {
+                'title': listing.title,
+                'price': listing.price,
+                'market_price': market_price,
+                'deal_score': deal_score,
+                'savings': market_price - listing.price,
+                'location': listing.location,
+                'url': listing.url,
+                'description': listing.description[:200] + "..." if len(listing.description) > 200 else listing.description,
+                'seller': listing.seller_name,
+                'posted_date': listing.posted_date,
+                'product_type': product_id.replace('_', ' ').title(),
+                'condition': condition.title()
+            }
+            deals.append(deal_info)
+            rows.append((
                 listing.title, listing.price, listing.currency, listing.location,
                 listing.url, listing.description, listing.posted_date,
                 listing.seller_name, listing.contact_info, listing.category,
                 market_price, deal_score
             ))
-            self.conn.commit()
+        
+        # Store all deals in a single transaction
+        self.store_listings_bulk(rows)
+        return deals
+    
+    def store_listings_bulk(self, rows: List[Tuple]):
+        """Store listing rows in database with a single commit"""
+        if not rows:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany('''
+                    INSERT OR REPLACE INTO listings 
+                    (title, price, currency, location, url, description, posted_date, 
+                     seller_name, contact_info, category, market_price, deal_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
         except Exception as e:
-            logging.error(f"Error storing listing: {e}")
+            logging.error(f"Error storing listings: {e}")
     
     def export_deals(self, deals: List[Dict], filename: str = None):
         """Export deals to various formats"""
@@ -467,14 +790,20 @@ class BazarakiScraper:
         
         # Export to CSV
         csv_filename = filename or f"bazaraki_deals_{timestamp}.csv"
-        df = pd.DataFrame(deals)
-        df.to_csv(csv_filename, index=False)
+        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(deals[0].keys()))
+            writer.writeheader()
+            writer.writerows(deals)
         logging.info(f"Deals exported to {csv_filename}")
         
         # Export to JSON
         json_filename = f"bazaraki_deals_{timestamp}.json"
-        with open(json_filename, 'w') as f:
-            json.dump(deals, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_filename, 'wb') as f:
+                f.write(orjson.dumps(deals, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, 'w', encoding='utf-8') as f:
+                json.dump(deals, f, indent=2, ensure_ascii=False)
         logging.info(f"Deals exported to {json_filename}")
         
         # Create HTML report
@@ -485,103 +814,46 @@ class BazarakiScraper:
     
     def create_html_report(self, deals: List[Dict], filename: str):
         """Create an HTML report of deals"""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Bazaraki Electronics Deals Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .deal {{ border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-                .deal-header {{ color: #d9534f; font-size: 18px; font-weight: bold; }}
-                .deal-score {{ background: #5cb85c; color: white; padding: 5px 10px; border-radius: 3px; display: inline-block; }}
-                .price {{ font-size: 20px; color: #337ab7; }}
-                .savings {{ color: #5cb85c; font-weight: bold; }}
-                .table {{ width: 100%; border-collapse: collapse; }}
-                .table th, .table td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                .table th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <h1>Bazaraki Electronics Deals Report</h1>
-            <p>Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-            <p>Total deals found: {len(deals)}</p>
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(_REPORT_HEADER_TMPL.format(
+                generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                total=len(deals)
+            ))
             
-            <h2>Top Deals Summary</h2>
-            <table class="table">
-                <tr>
-                    <th>Product</th>
-                    <th>Price</th>
-                    <th>Market Price</th>
-                    <th>Savings</th>
-                    <th>Deal Score</th>
-                    <th>Location</th>
-                </tr>
-        """
-        
-        for deal in deals[:10]:  # Top 10 deals in table
-            html_content += f"""
-                <tr>
-                    <td>{deal['title'][:50]}...</td>
-                    <td>€{deal['price']:.2f}</td>
-                    <td>€{deal['market_price']:.2f}</td>
-                    <td class="savings">€{deal['savings']:.2f}</td>
-                    <td><span class="deal-score">{deal['deal_score']:.1f}%</span></td>
-                    <td>{deal['location']}</td>
-                </tr>
-            """
-        
-        html_content += """
-            </table>
+            for deal in deals[:10]:  # Top 10 deals in table
+                f.write(_REPORT_ROW_TMPL.format_map(deal))
             
-            <h2>Detailed Deals</h2>
-        """
-        
-        for deal in deals:
-            html_content += f"""
-            <div class="deal">
-                <div class="deal-header">{deal['title']}</div>
-                <div class="price">€{deal['price']:.2f} 
-                    <span class="deal-score">{deal['deal_score']:.1f}% OFF</span>
-                </div>
-                <p><strong>Market Price:</strong> €{deal['market_price']:.2f}</p>
-                <p><strong>You Save:</strong> <span class="savings">€{deal['savings']:.2f}</span></p>
-                <p><strong>Type:</strong> {deal['product_type']} ({deal['condition']})</p>
-                <p><strong>Location:</strong> {deal['location']}</p>
-                <p><strong>Seller:</strong> {deal['seller']}</p>
-                <p><strong>Posted:</strong> {deal['posted_date']}</p>
-                <p><strong>Description:</strong> {deal['description']}</p>
-                <p><a href="{deal['url']}" target="_blank">View Listing</a></p>
-            </div>
-            """
-        
-        html_content += """
-        </body>
-        </html>
-        """
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(_REPORT_DETAILS_HEADING)
+            
+            for deal in deals:
+                f.write(_REPORT_CARD_TMPL.format_map(deal))
+            
+            f.write(_REPORT_FOOTER)
         logging.info(f"HTML report created: {filename}")
     
     def run_full_scan(self, max_pages_per_category: int = 3) -> List[Dict]:
         """Run a full scan of electronics categories"""
         logging.info("Starting full scan of Bazaraki electronics categories")
-        
+
         all_listings = []
         categories = self.get_electronics_categories()
         
-        for category_url in categories:
-            logging.info(f"Scraping category: {category_url}")
-            try:
-                listings = self.scrape_category(category_url, max_pages_per_category)
-                all_listings.extend(listings)
-                logging.info(f"Found {len(listings)} listings in category")
-                time.sleep(3)  # Rate limiting between categories
-            except Exception as e:
-                logging.error(f"Error scraping category {category_url}: {e}")
-                continue
-        
+        # Scrape categories in parallel; a worker only starts its WebDriver
+        # if a page needs the Selenium fallback
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._scrape_category_in_worker, category_url, max_pages_per_category)
+                    for category_url in categories
+                ]
+                for category_url, future in zip(categories, futures):
+                    try:
+                        all_listings.extend(future.result())
+                    except Exception as e:
+                        logging.error(f"Error scraping category {category_url}: {e}")
+        finally:
+            self.quit_drivers()
+
         logging.info(f"Total listings collected: {len(all_listings)}")
         
         # Analyze for deals
@@ -592,8 +864,8 @@ class BazarakiScraper:
     
     def close(self):
         """Clean up resources"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        if hasattr(self, '_driver_slots'):
+            self.quit_drivers()
         if hasattr(self, 'conn'):
             self.conn.close()
 
@@ -5,62 +5,103 @@ Simple menu-driven interface for running the scraper
 """
 
 import os
+import shutil
 import sys
-import subprocess
-from datetime import datetime
+from importlib.util import find_spec
+
+# Modules the scraper needs; probed with find_spec so the launcher never imports them
+REQUIRED_MODULES = ('aiohttp', 'selectolax', 'numpy', 'selenium')
+
+# Files the launcher expects next to it
+REQUIRED_FILES = frozenset({'bazaraki_scraper.py', 'requirements.txt'})
+
+# Set once check_setup has found every required module
+_setup_ok = False
+
+# Set once check_setup has found every required file
+_files_ok = False
+
+# Screens are pre-joined so each one goes to the terminal in a single write
+_BANNER = (
+    "🔍💻📱 BAZARAKI ELECTRONICS DEAL FINDER 💰🎯\n"
+    + "=" * 60 + "\n"
+    + "Find amazing electronics deals on Cyprus's largest marketplace!\n"
+    + "=" * 60 + "\n"
+)
+
+_MENU_TEXT = (
+    "\n📋 MAIN MENU\n"
+    + "-" * 30 + "\n"
+    "1. 🛠️  Setup & Install Dependencies\n"
+    "2. 🧪 Run System Tests\n"
+    "3. 🚀 Run Deal Finder (Quick Scan)\n"
+    "4. 🔍 Run Deal Finder (Full Scan)\n"
+    "5. 📊 View Previous Results\n"
+    "6. ⚙️  Configuration\n"
+    "7. 📖 Help & Documentation\n"
+    "8. 🚪 Exit\n"
+)
 
 def print_banner():
     """Print application banner"""
-    print("🔍💻📱 BAZARAKI ELECTRONICS DEAL FINDER 💰🎯")
-    print("=" * 60)
-    print("Find amazing electronics deals on Cyprus's largest marketplace!")
-    print("=" * 60)
+    sys.stdout.write(_BANNER)
 
 def run_command(cmd):
-    """Run a system command"""
+    """Run an external command given as an argument list, streaming its output"""
+    import subprocess
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        return False, e.stderr
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+    except OSError as e:
+        return False, str(e)
+    
+    # Write child output straight to the terminal as it arrives
+    sys.stdout.flush()
+    for line in iter(proc.stdout.readline, b''):
+        os.write(sys.stdout.fileno(), line)
+    proc.stdout.close()
+    return proc.wait() == 0, ''
 
 def check_setup():
     """Check if the system is properly set up"""
+    global _files_ok, _setup_ok
     print("🔧 Checking system setup...")
     
-    # Check if required files exist
-    required_files = ['bazaraki_scraper.py', 'requirements.txt']
-    missing_files = [f for f in required_files if not os.path.exists(f)]
-    
-    if missing_files:
-        print(f"❌ Missing files: {missing_files}")
-        return False
+    # Check if required files exist with a single directory read,
+    # stopping as soon as all of them have been seen
+    if not _files_ok:
+        found = set()
+        with os.scandir('.') as entries:
+            for entry in entries:
+                if entry.name in REQUIRED_FILES:
+                    found.add(entry.name)
+                    if len(found) == len(REQUIRED_FILES):
+                        break
+        missing_files = sorted(REQUIRED_FILES - found)
+        
+        if missing_files:
+            print(f"❌ Missing files: {missing_files}")
+            return False
+        _files_ok = True
     
-    # Try importing required modules
-    try:
-        import requests
-        import selenium
-        import pandas
+    # Locate required modules without importing them
+    if _setup_ok:
         print("✅ Required packages available")
         return True
-    except ImportError as e:
-        print(f"❌ Missing package: {e}")
+    
+    missing_packages = [m for m in REQUIRED_MODULES if find_spec(m) is None]
+    if missing_packages:
+        print(f"❌ Missing packages: {missing_packages}")
         print("Run option 1 (Setup) first")
         return False
+    
+    _setup_ok = True
+    print("✅ Required packages available")
+    return True
 
 def main_menu():
     """Display main menu and handle user choice"""
     while True:
-        print("\n📋 MAIN MENU")
-        print("-" * 30)
-        print("1. 🛠️  Setup & Install Dependencies")
-        print("2. 🧪 Run System Tests")
-        print("3. 🚀 Run Deal Finder (Quick Scan)")
-        print("4. 🔍 Run Deal Finder (Full Scan)")
-        print("5. 📊 View Previous Results")
-        print("6. ⚙️  Configuration")
-        print("7. 📖 Help & Documentation")
-        print("8. 🚪 Exit")
+        sys.stdout.write(_MENU_TEXT)
         
         choice = input("\nEnter your choice (1-8): ").strip()
         
@@ -89,32 +130,44 @@ def setup_system():
     print("\n🛠️ SYSTEM SETUP")
     print("-" * 20)
     
-    if os.path.exists('setup.py'):
+    try:
+        import setup
+    except ModuleNotFoundError as e:
+        if e.name != 'setup':
+            raise
+        setup = None
+    
+    if setup:
         print("Running setup script...")
-        success, output = run_command("python setup.py")
-        if success:
+        try:
+            setup.main()
             print("✅ Setup completed successfully!")
-        else:
-            print(f"❌ Setup failed: {output}")
+        except Exception as e:
+            print(f"❌ Setup failed: {e}")
     else:
         print("❌ setup.py not found!")
         print("Installing dependencies manually...")
-        success, output = run_command("pip install -r requirements.txt")
+        success, output = run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
         if success:
             print("✅ Dependencies installed!")
         else:
-            print(f"❌ Failed to install dependencies: {output}")
+            print(f"❌ Failed to install dependencies{': ' + output if output else ''}")
 
 def run_tests():
     """Run system tests"""
     print("\n🧪 RUNNING TESTS")
     print("-" * 20)
     
-    if os.path.exists('test_scraper.py'):
-        success, output = run_command("python test_scraper.py")
-        print(output)
-    else:
-        print("❌ test_scraper.py not found!")
+    try:
+        import test_scraper
+        test_scraper.main()
+    except ModuleNotFoundError as e:
+        if e.name == 'test_scraper':
+            print("❌ test_scraper.py not found!")
+        else:
+            print(f"❌ Tests could not run: {e}")
+    except Exception as e:
+        print(f"❌ Tests could not run: {e}")
 
 def run_quick_scan():
     """Run quick scan (1 page per category)"""
@@ -126,10 +179,18 @@ def run_quick_scan():
         return
     
     print("Starting quick scan...")
-    # Modify the scraper to run with limited pages
-    cmd = "python -c \"from bazaraki_scraper import BazarakiScraper; s = BazarakiScraper(); deals = s.run_full_scan(1); s.export_deals(deals); s.close(); print(f'Found {len(deals)} deals!')\""
-    success, output = run_command(cmd)
-    print(output)
+    scraper = None
+    try:
+        from bazaraki_scraper import BazarakiScraper
+        scraper = BazarakiScraper()
+        deals = scraper.run_full_scan(1)
+        scraper.export_deals(deals)
+        print(f"Found {len(deals)} deals!")
+    except Exception as e:
+        print(f"❌ Quick scan failed: {e}")
+    finally:
+        if scraper:
+            scraper.close()
 
 def run_full_scan():
     """Run full scan"""
@@ -141,8 +202,32 @@ def run_full_scan():
         return
     
     print("Starting full scan...")
-    success, output = run_command("python bazaraki_scraper.py")
-    print(output)
+    import bazaraki_scraper
+    bazaraki_scraper.main()
+
+# Result file listing, reused until the directory changes
+_results_cache = {'mtime': None, 'html': [], 'csv': []}
+
+def find_result_files():
+    """Return (html_reports, csv_files) in the current directory, newest first"""
+    mtime = os.stat('.').st_mtime_ns
+    if _results_cache['mtime'] == mtime:
+        return _results_cache['html'], _results_cache['csv']
+    
+    html_files = []
+    csv_files = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith('bazaraki_deals_') or not entry.is_file(follow_symlinks=False):
+                continue
+            if name.startswith('bazaraki_deals_report_') and name.endswith('.html'):
+                html_files.append(name)
+            elif name.endswith('.csv'):
+                csv_files.append(name)
+    
+    _results_cache.update(mtime=mtime, html=sorted(html_files, reverse=True), csv=sorted(csv_files, reverse=True))
+    return _results_cache['html'], _results_cache['csv']
 
 def view_results():
     """View previous results"""
@@ -150,8 +235,7 @@ def view_results():
     print("-" * 20)
     
     # Look for result files
-    html_files = [f for f in os.listdir('.') if f.startswith('bazaraki_deals_report_') and f.endswith('.html')]
-    csv_files = [f for f in os.listdir('.') if f.startswith('bazaraki_deals_') and f.endswith('.csv')]
+    html_files, csv_files = find_result_files()
     
     if not html_files and not csv_files:
         print("❌ No previous results found.")
@@ -163,13 +247,13 @@ def view_results():
     all_files = []
     if html_files:
         print("\n🌐 HTML Reports:")
-        for i, f in enumerate(sorted(html_files, reverse=True), 1):
+        for i, f in enumerate(html_files, 1):
             print(f"  {i}. {f}")
             all_files.append(f)
     
     if csv_files:
         print("\n📋 CSV Files:")
-        for i, f in enumerate(sorted(csv_files, reverse=True), len(all_files) + 1):
+        for i, f in enumerate(csv_files, len(all_files) + 1):
             print(f"  {i}. {f}")
             all_files.append(f)
     
@@ -178,9 +262,10 @@ def view_results():
         if choice.isdigit() and 1 <= int(choice) <= len(all_files):
             filename = all_files[int(choice) - 1]
             if filename.endswith('.html'):
-                # Try to open in browser
+                # Try to open in browser without holding up the menu
+                import threading
                 import webbrowser
-                webbrowser.open(f'file://{os.path.abspath(filename)}')
+                threading.Thread(target=webbrowser.open, args=(f'file://{os.path.abspath(filename)}',), daemon=True).start()
                 print(f"📖 Opened {filename} in browser")
             else:
                 print(f"📂 File location: {os.path.abspath(filename)}")
@@ -197,24 +282,23 @@ def configure_system():
         recreate = input("Recreate config.ini? (y/n): ").lower().strip()
         if recreate == 'y':
             # Recreate config
-            success, output = run_command("python -c \"from setup import create_config_file; create_config_file()\"")
-            if success:
+            try:
+                from setup import create_config_file
+                create_config_file()
                 print("✅ Configuration file recreated!")
-            else:
+            except Exception:
                 print("❌ Failed to recreate configuration")
     else:
         print("Creating configuration file...")
-        success, output = run_command("python -c \"from setup import create_config_file; create_config_file()\"")
-        if success:
+        try:
+            from setup import create_config_file
+            create_config_file()
             print("✅ Configuration file created!")
-        else:
+        except Exception:
             print("❌ Failed to create configuration")
 
 def show_help():
     """Show help and documentation"""
-    print("\n📖 HELP & DOCUMENTATION")
-    print("-" * 30)
-    
     help_text = """
 🎯 WHAT THIS TOOL DOES:
    Finds electronics deals on bazaraki.com by comparing prices
@@ -251,22 +335,32 @@ def show_help():
    • Results saved in deals_reports/ folder
     """
     
-    print(help_text)
+    sys.stdout.write("\n📖 HELP & DOCUMENTATION\n" + "-" * 30 + "\n" + help_text + "\n")
     
-    # Check if README exists
-    if os.path.exists('README.md'):
+    # Offer the README only if it can be opened
+    try:
+        f = open('README.md', 'rb')
+    except FileNotFoundError:
+        return
+    
+    with f:
         view_readme = input("\nView detailed README? (y/n): ").lower().strip()
         if view_readme == 'y':
-            with open('README.md', 'r') as f:
-                print("\n" + "="*60)
-                print(f.read())
+            sys.stdout.write("\n" + "="*60 + "\n")
+            sys.stdout.flush()
+            # Copy the raw bytes in chunks rather than reading the whole file
+            shutil.copyfileobj(f, sys.stdout.buffer)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
 
 def main():
     """Main application entry point"""
     print_banner()
     
     # Quick system check
-    if not os.path.exists('bazaraki_scraper.py'):
+    try:
+        open('bazaraki_scraper.py', 'rb').close()
+    except FileNotFoundError:
         print("❌ bazaraki_scraper.py not found!")
         print("Make sure you're in the correct directory.")
         sys.exit(1)
@@ -7,38 +7,60 @@ Installs required dependencies and Chrome browser
 import subprocess
 import sys
 import os
+import shutil
+import time
 from pathlib import Path
 
-def run_command(cmd, check=True):
-    """Run a shell command"""
-    print(f"Running: {cmd}")
+# apt refreshes this stamp after every successful index update
+APT_UPDATE_STAMP = '/var/lib/apt/periodic/update-success-stamp'
+APT_INDEX_MAX_AGE = 24 * 60 * 60
+
+def apt_index_is_fresh():
+    """Whether the apt package index was updated within APT_INDEX_MAX_AGE"""
     try:
-        result = subprocess.run(cmd, shell=True, check=check, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+        return time.time() - os.path.getmtime(APT_UPDATE_STAMP) < APT_INDEX_MAX_AGE
+    except OSError:
         return False
 
+def run_command(cmd, check=True):
+    """Run a shell command, streaming its output"""
+    print(f"Running: {cmd}")
+    sys.stdout.flush()
+    
+    # Write child output straight to the terminal as it arrives
+    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+    for line in iter(proc.stdout.readline, b''):
+        os.write(sys.stdout.fileno(), line)
+    proc.stdout.close()
+    
+    returncode = proc.wait()
+    if check and returncode != 0:
+        print(f"Error running command: exit status {returncode}")
+    return returncode == 0
+
 def install_chrome():
     """Install Google Chrome"""
     print("🌐 Installing Google Chrome...")
     
     # Detect OS
     if sys.platform.startswith('linux'):
-        commands = [
-            "wget -q -O - https://dl.google.com/linux/linux_signing_key.pub | sudo apt-key add -",
-            "echo 'deb [arch=amd64] http://dl.google.com/linux/chrome/deb/ stable main' | sudo tee /etc/apt/sources.list.d/google-chrome.list",
-            "sudo apt update",
-            "sudo apt install -y google-chrome-stable"
+        if shutil.which('google-chrome') or shutil.which('google-chrome-stable'):
+            print("✅ Chrome is already installed")
+            return True
+        
+        steps = [
+            "set -euo pipefail",
+            "wget -q -O - https://dl.google.com/linux/linux_signing_key.pub | apt-key add -",
+            'echo "deb [arch=amd64] http://dl.google.com/linux/chrome/deb/ stable main" > /etc/apt/sources.list.d/google-chrome.list',
         ]
-        for cmd in commands:
-            if not run_command(cmd):
-                print("❌ Failed to install Chrome")
-                return False
+        if not apt_index_is_fresh():
+            steps.append("apt-get update")
+        steps.append("apt-get install -y google-chrome-stable")
+        
+        # One root shell for every step: a single sudo and process tree
+        if not run_command(f"sudo bash -c '{'; '.join(steps)}'"):
+            print("❌ Failed to install Chrome")
+            return False
     elif sys.platform == 'darwin':  # macOS
         if not run_command("brew install --cask google-chrome", check=False):
             print("Please install Chrome manually from https://www.google.com/chrome/")
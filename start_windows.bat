@@ -74,7 +74,7 @@ if %errorlevel% == 0 (
     echo.
     echo 🔧 Try these manual commands:
     echo %PYTHON_CMD% -m pip install --upgrade pip
-    echo %PYTHON_CMD% -m pip install requests beautifulsoup4 pandas selenium webdriver-manager lxml openpyxl
+    echo %PYTHON_CMD% -m pip install requests numpy selenium webdriver-manager selectolax aiohttp openpyxl
     echo.
 )
 
@@ -5,79 +5,108 @@ Validates setup and basic functionality
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+import shutil
 import sys
 import time
+from importlib import metadata
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
 
-def test_internet_connection():
+# Shared keep-alive session for the reachability checks
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
+# chromedriver binary; when it is not on PATH, the path Selenium resolves on
+# the first launch is kept so selenium-manager does not run again
+_DRIVER_PATH = shutil.which('chromedriver')
+
+# (title, expected product id) pairs for the market price database test
+_TEST_CASES = (
+    ("iPhone 15 Pro Max 256GB", "iphone_15_pro_max"),
+    ("MacBook Air 13 inch M2", "macbook_air_13"),
+    ("Dell XPS 15 laptop", "dell_xps_15"),
+    ("Random product xyz", None),
+)
+
+def _make_driver():
+    """Create a headless Chrome driver for the browser tests"""
+    global _DRIVER_PATH
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    driver = webdriver.Chrome(service=Service(_DRIVER_PATH), options=chrome_options)
+    _DRIVER_PATH = driver.service.path
+    return driver
+
+def test_internet_connection(log=print):
     """Test internet connectivity"""
-    print("🌐 Testing internet connection...")
+    log("🌐 Testing internet connection...")
     try:
-        response = requests.get("https://www.google.com", timeout=10)
+        response = _SESSION.head("https://www.google.com", timeout=10, allow_redirects=True)
         if response.status_code == 200:
-            print("✅ Internet connection: OK")
+            log("✅ Internet connection: OK")
             return True
         else:
-            print("❌ Internet connection: Failed")
+            log("❌ Internet connection: Failed")
             return False
     except Exception as e:
-        print(f"❌ Internet connection error: {e}")
+        log(f"❌ Internet connection error: {e}")
         return False
 
-def test_bazaraki_access():
+def test_bazaraki_access(log=print):
     """Test access to bazaraki.com"""
-    print("🏪 Testing bazaraki.com access...")
+    log("🏪 Testing bazaraki.com access...")
     try:
-        response = requests.get("https://www.bazaraki.com", timeout=15)
+        response = _SESSION.head("https://www.bazaraki.com", timeout=15, allow_redirects=True)
         if response.status_code == 200:
-            print("✅ Bazaraki.com access: OK")
-            print(f"   Response size: {len(response.content)} bytes")
+            log("✅ Bazaraki.com access: OK")
+            log(f"   Response size: {response.headers.get('Content-Length', 'unknown')} bytes")
             return True
         else:
-            print(f"❌ Bazaraki.com access failed: Status {response.status_code}")
+            log(f"❌ Bazaraki.com access failed: Status {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Bazaraki.com access error: {e}")
+        log(f"❌ Bazaraki.com access error: {e}")
         return False
 
-def test_chrome_installation():
+def test_chrome_installation(driver=None):
     """Test Chrome browser installation"""
     print("🌐 Testing Chrome browser...")
+    owns_driver = driver is None
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        driver = webdriver.Chrome(options=chrome_options)
+        if owns_driver:
+            driver = _make_driver()
         driver.get("https://www.google.com")
         
         if "Google" in driver.title:
             print("✅ Chrome browser: OK")
             print(f"   Version: {driver.capabilities['browserVersion']}")
-            driver.quit()
             return True
         else:
             print("❌ Chrome browser: Failed to load page")
-            driver.quit()
             return False
             
     except Exception as e:
         print(f"❌ Chrome browser error: {e}")
         print("   Make sure Chrome is installed and accessible")
         return False
+    finally:
+        if owns_driver and driver:
+            driver.quit()
 
-def test_selenium_bazaraki():
+def test_selenium_bazaraki(driver=None):
     """Test Selenium with Bazaraki"""
     print("🤖 Testing Selenium with Bazaraki...")
+    owns_driver = driver is None
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        driver = webdriver.Chrome(options=chrome_options)
+        if owns_driver:
+            driver = _make_driver()
         driver.get("https://www.bazaraki.com")
         time.sleep(3)
         
@@ -88,13 +117,14 @@ def test_selenium_bazaraki():
         print(f"✅ Selenium + Bazaraki: OK")
         print(f"   Page title: {title}")
         print(f"   Page source size: {page_source_length} bytes")
-        
-        driver.quit()
         return True
         
     except Exception as e:
         print(f"❌ Selenium + Bazaraki error: {e}")
         return False
+    finally:
+        if owns_driver and driver:
+            driver.quit()
 
 def test_market_price_database():
     """Test market price database functionality"""
@@ -107,21 +137,14 @@ def test_market_price_database():
         db = MarketPriceDatabase()
         
         # Test product identification
-        test_cases = [
-            ("iPhone 15 Pro Max 256GB", "should find iphone_15_pro_max"),
-            ("MacBook Air 13 inch M2", "should find macbook_air_13"),
-            ("Dell XPS 15 laptop", "should find dell_xps_15"),
-            ("Random product xyz", "should return None")
-        ]
-        
         success_count = 0
-        for test_title, expected in test_cases:
-            product_id, condition = db.identify_product(test_title, "")
-            if product_id or "None" in expected:
+        for test_title, expected in _TEST_CASES:
+            product_id, condition = db.identify_product(test_title.lower(), "")
+            if product_id == expected:
                 success_count += 1
                 print(f"   ✅ '{test_title}' -> {product_id}")
             else:
-                print(f"   ❌ '{test_title}' -> {product_id} (expected match)")
+                print(f"   ❌ '{test_title}' -> {product_id} (expected {expected})")
         
         if success_count >= 3:
             print("✅ Market price database: OK")
@@ -134,60 +157,119 @@ def test_market_price_database():
         print(f"❌ Market price database error: {e}")
         return False
 
-def test_dependencies():
+def test_dependencies(log=print):
     """Test required Python packages"""
-    print("📦 Testing Python dependencies...")
+    log("📦 Testing Python dependencies...")
+    # What bazaraki_scraper imports at module level
     required_packages = [
-        'requests', 'beautifulsoup4', 'pandas', 
-        'selenium', 'sqlite3', 'lxml'
+        'aiohttp', 'selectolax', 'numpy',
+        'selenium', 'sqlite3'
     ]
     
+    # Read installed distribution metadata instead of importing every package
+    installed = {
+        (dist.metadata['Name'] or '').lower().replace('-', '_')
+        for dist in metadata.distributions()
+    }
+    
     missing_packages = []
     for package in required_packages:
-        try:
-            if package == 'beautifulsoup4':
-                import bs4
-            elif package == 'sqlite3':
-                import sqlite3
-            else:
-                __import__(package)
-            print(f"   ✅ {package}")
-        except ImportError:
-            print(f"   ❌ {package} - MISSING")
+        if package == 'sqlite3':
+            # Part of the standard library, so there is no distribution to find
+            found = find_spec('sqlite3') is not None
+        else:
+            found = package.replace('-', '_') in installed
+        
+        if found:
+            log(f"   ✅ {package}")
+        else:
+            log(f"   ❌ {package} - MISSING")
             missing_packages.append(package)
     
     if not missing_packages:
-        print("✅ All dependencies: OK")
+        log("✅ All dependencies: OK")
         return True
     else:
-        print(f"❌ Missing packages: {missing_packages}")
-        print("   Run: pip install -r requirements.txt")
+        log(f"❌ Missing packages: {missing_packages}")
+        log("   Run: pip install -r requirements.txt")
         return False
 
+def run_test(test):
+    """Run a single (name, function) test, treating exceptions as failures"""
+    test_name, test_func = test
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"❌ {test_name} failed with exception: {e}")
+        return False
+
+def run_logged_test(test):
+    """Run a (name, function) test with its output collected instead of printed
+
+    Returns (name, result, output lines), so tests run on worker threads can
+    have their output printed in order once they finish.
+    """
+    test_name, test_func = test
+    lines = []
+    try:
+        result = test_func(log=lines.append)
+    except Exception as e:
+        lines.append(f"❌ {test_name} failed with exception: {e}")
+        result = False
+    return test_name, result, lines
+
+def run_stage(tests, results):
+    """Run independent tests concurrently, then print each one's output under its own header"""
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        logged = list(executor.map(run_logged_test, tests))
+    
+    for test_name, result, lines in logged:
+        print(f"\n{'='*20} {test_name} {'='*20}")
+        for line in lines:
+            print(line)
+        results[test_name] = result
+
+def run_chrome_tests(tests, results):
+    """Run the browser tests one after another against a single shared driver"""
+    print(f"\n{'='*20} Chrome {'='*20}")
+    try:
+        driver = _make_driver()
+    except Exception as e:
+        print(f"❌ Chrome browser error: {e}")
+        print("   Make sure Chrome is installed and accessible")
+        for test_name, _ in tests:
+            results[test_name] = False
+        return
+    
+    try:
+        for test_name, test_func in tests:
+            results[test_name] = run_test((test_name, lambda: test_func(driver)))
+    finally:
+        driver.quit()
+
 def main():
     """Run all tests"""
     print("🧪 Bazaraki Scraper Test Suite")
     print("=" * 50)
     
-    tests = [
+    # Network/import probes are independent of each other, so they run concurrently
+    network_tests = [
         ("Dependencies", test_dependencies),
         ("Internet Connection", test_internet_connection),
         ("Bazaraki Access", test_bazaraki_access),
+    ]
+    chrome_tests = [
         ("Chrome Browser", test_chrome_installation),
         ("Selenium + Bazaraki", test_selenium_bazaraki),
-        ("Market Price Database", test_market_price_database),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
-            results.append((test_name, False))
-        time.sleep(1)
+    results = {}
+    run_stage(network_tests, results)
+    run_chrome_tests(chrome_tests, results)
+    
+    # Imports the scraper module, so keep it on the main thread
+    print(f"\n{'='*20} Market Price Database {'='*20}")
+    results["Market Price Database"] = run_test(("Market Price Database", test_market_price_database))
     
     # Summary
     print(f"\n{'='*50}")
@@ -195,7 +277,7 @@ def main():
     print("=" * 50)
     
     passed = 0
-    for test_name, result in results:
+    for test_name, result in results.items():
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{test_name:.<30} {status}")
         if result: